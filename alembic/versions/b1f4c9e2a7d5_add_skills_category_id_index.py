@@ -0,0 +1,26 @@
+"""add_skills_category_id_index
+
+Revision ID: b1f4c9e2a7d5
+Revises: 7462e3534aeb
+Create Date: 2026-10-17 10:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1f4c9e2a7d5'
+down_revision = '7462e3534aeb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index the skills foreign key used to group skills by category
+    op.create_index(op.f('ix_skills_category_id'), 'skills', ['category_id'], unique=False)
+
+
+def downgrade() -> None:
+    # Remove the skills category index
+    op.drop_index(op.f('ix_skills_category_id'), table_name='skills')
@@ -2,10 +2,19 @@
 
 from sqladmin import Admin
 from sqladmin.authentication import AuthenticationBackend
+from sqlalchemy import bindparam, select
 from starlette.requests import Request
 
 from app.config import settings
 from app.database import engine
+from app.models.user import User
+
+# Hash of a random throwaway password, checked when the login email is unknown
+# so that both branches pay for a bcrypt verification (no timing oracle)
+_DUMMY_PASSWORD_HASH = "$2b$12$WgCxkYvpn55ABdFiXj04d.YZ7c8ajux2O07K8SDnC/gGeYHd/F7X2"
+
+# Login lookup, built once so SQLAlchemy reuses its compiled form
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
 
 
 class AdminAuth(AuthenticationBackend):
@@ -17,19 +26,17 @@ class AdminAuth(AuthenticationBackend):
         username, password = form["username"], form["password"]
 
         # Use the same authentication as API
-        from app.auth.oauth import AuthService
+        from app.auth.oauth import auth_service
         from app.database import SessionLocal
-        from app.models.user import User
 
-        auth_service = AuthService()
         db = SessionLocal()
         try:
-            user = db.query(User).filter(User.email == username).first()
-            if (
-                user
-                and user.is_active
-                and auth_service.verify_password(str(password), str(user.password_hash))
-            ):
+            user = db.execute(_USER_BY_EMAIL, {"email": username}).scalar_one_or_none()
+            # Always verify, against a dummy hash for unknown users
+            password_ok = auth_service.verify_password(
+                str(password), user.password_hash if user else _DUMMY_PASSWORD_HASH
+            )
+            if user and user.is_active and password_ok:
                 # Store user info in session
                 request.session.update(
                     {
@@ -15,6 +15,7 @@ from app.models.skills import Skill, SkillCategory
 
 # Import all models
 from app.models.user import User
+from app.utils.response_cache import response_cache
 
 
 def is_admin_user(request: Request) -> bool:
@@ -104,6 +105,12 @@ class SiteConfigAdmin(ModelView, model=SiteConfig):
         "updated_at": "Última modificación",
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -150,6 +157,12 @@ class AboutAdmin(ModelView, model=About):
         "updated_at": "Última modificación",
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -187,6 +200,12 @@ class ContactAdmin(ModelView, model=Contact):
         "updated_at": "Última modificación",
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -239,6 +258,12 @@ class SkillCategoryAdmin(ModelView, model=SkillCategory):
         "updated_at": "Última modificación",
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -315,6 +340,12 @@ UI: <code>code</code>, <code>database</code>, <code>server</code>, <code>setting
         },
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -381,6 +412,12 @@ class ProjectAdmin(ModelView, model=Project):
         }
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -429,6 +466,12 @@ class ExperienceAdmin(ModelView, model=Experience):
         "created_at": "Fecha de creación",
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
@@ -475,6 +518,12 @@ class EducationAdmin(ModelView, model=Education):
         "created_at": "Fecha de creación",
     }
 
+    async def after_model_change(self, data, model, is_created) -> None:
+        response_cache.clear()
+
+    async def after_model_delete(self, model) -> None:
+        response_cache.clear()
+
     def is_accessible(self, request: Request) -> bool:
         return is_admin_user(request)
 
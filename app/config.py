@@ -11,6 +11,8 @@ class Settings(BaseSettings):
     postgres_user: str = "postgres"
     postgres_password: str = ""
     postgres_db: str = "portfolio_db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
 
     @property
     def database_url(self) -> str:
@@ -145,6 +147,9 @@ class Settings(BaseSettings):
     enable_http_cache: bool = True
     enable_compression: bool = True
 
+    # ORM Settings
+    strict_loading: bool = False  # Raise on lazy relationship loads (dev/test)
+
     # File Storage Settings
     uploads_path: str = "uploads"
     max_file_size: int = 10 * 1024 * 1024  # 10MB
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from fastapi import Query
+
+from app.config import settings
+from app.utils.validation import validate_language
+
+
+def get_language(
+    lang: Optional[str] = Query(
+        default=settings.default_language, description="Language code (en, es)"
+    ),
+) -> str:
+    """Language query parameter dependency, validated and normalized."""
+    return validate_language(lang)
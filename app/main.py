@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.middleware.sessions import SessionMiddleware
@@ -27,7 +28,6 @@ from app.middleware.monitoring import (
     system_metrics_collector,
 )
 from app.middleware.performance import (
-    CacheMiddleware,
     CompressionMiddleware,
     PerformanceMonitoringMiddleware,
 )
@@ -40,6 +40,7 @@ from app.middleware.security import (
 )
 from app.routers import (
     about,
+    bootstrap,
     contact,
     education,
     experience,
@@ -102,6 +103,7 @@ app = FastAPI(
     version="1.0.0",
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add proxy middleware for HTTPS handling (must be first)
@@ -137,13 +139,14 @@ app.add_middleware(
 app.add_middleware(InputSanitizationMiddleware)
 app.add_middleware(RequestSizeMiddleware, max_size=settings.max_upload_size)
 
-# Add performance middleware (cache before compression to avoid encoding issues)
+# Content responses are cached in-process by app.utils.response_cache, which the
+# admin views clear on every write, so CacheMiddleware is not stacked on top
 if settings.should_enable_cache:
-    app.add_middleware(CacheMiddleware, default_ttl=settings.cache_ttl_content)
-    app_logger.info("HTTP cache enabled for production environment")
+    app_logger.info("Response cache enabled for production environment")
 else:
-    app_logger.info(f"HTTP cache disabled for {settings.environment} environment")
+    app_logger.info(f"Response cache disabled for {settings.environment} environment")
 
+# Add performance middleware
 if settings.enable_compression:
     app.add_middleware(CompressionMiddleware, minimum_size=1000)
 
@@ -174,6 +177,7 @@ app.include_router(projects.router, prefix="/api/v1")
 app.include_router(experience.router, prefix="/api/v1")
 app.include_router(education.router, prefix="/api/v1")
 app.include_router(contact.router, prefix="/api/v1")
+app.include_router(bootstrap.router, prefix="/api/v1")
 
 # Mount static files for uploads
 uploads_dir = os.path.join(os.getcwd(), settings.uploads_path)
@@ -3,6 +3,7 @@ Monitoring middleware for automated metrics collection.
 """
 
 import asyncio
+import re
 import time
 
 from fastapi import Request
@@ -14,6 +15,12 @@ from app.utils.logging import get_logger
 
 logger = get_logger("portfolio.monitoring.middleware")
 
+# Path segments replaced by placeholders when normalizing metric paths
+_NUMERIC_ID_RE = re.compile(r"/\d+(?=/|$)")
+_UUID_RE = re.compile(
+    r"/[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}(?=/|$)"
+)
+
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     """Middleware to automatically collect request metrics."""
@@ -80,16 +87,10 @@ class MetricsMiddleware(BaseHTTPMiddleware):
 
     def _normalize_path(self, path: str) -> str:
         """Normalize path for consistent metrics (replace IDs with placeholders)."""
-        import re
-
         # Replace numeric IDs with placeholder
-        path = re.sub(r"/\d+(?=/|$)", "/{id}", path)
+        path = _NUMERIC_ID_RE.sub("/{id}", path)
         # Replace UUID patterns
-        path = re.sub(
-            r"/[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}(?=/|$)",
-            "/{uuid}",
-            path,
-        )
+        path = _UUID_RE.sub("/{uuid}", path)
         return path
 
     def _is_suspicious_error(self, error: Exception, request: Request) -> bool:
@@ -156,7 +157,6 @@ class SystemMetricsCollector:
             return
 
         self.is_running = True
-        import asyncio
 
         async def collect_loop():
             while self.is_running:
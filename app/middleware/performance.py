@@ -3,6 +3,7 @@ Performance middleware for Portfolio Backend API.
 """
 
 import gzip
+import json
 import time
 from typing import List
 
@@ -13,6 +14,7 @@ from starlette.types import ASGIApp
 
 from app.utils.cache import cache_manager
 from app.utils.logging import get_logger
+from app.utils.response_cache import etag_matches
 
 logger = get_logger("portfolio.performance")
 
@@ -57,6 +59,11 @@ class CacheMiddleware(BaseHTTPMiddleware):
             if cached_response:
                 logger.debug(f"Cache hit for {path}")
 
+                # Short-circuit with 304 when the client already has this body
+                etag = cached_response["headers"].get("etag")
+                if etag and etag_matches(request, etag):
+                    return Response(status_code=304, headers={"ETag": etag})
+
                 # Reconstruct response
                 return JSONResponse(
                     content=cached_response["content"],
@@ -83,8 +90,6 @@ class CacheMiddleware(BaseHTTPMiddleware):
                     response_body += chunk
 
                 # Parse JSON response
-                import json
-
                 content = json.loads(response_body.decode())
 
                 # Prepare cache entry
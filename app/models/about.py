@@ -1,6 +1,10 @@
 """About model for personal information."""
 
-from sqlalchemy import Column, Date, DateTime, Integer, String, Text
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -11,35 +15,47 @@ class About(Base):
 
     __tablename__ = "about"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Personal Information
-    name = Column(String(100), nullable=False)
-    last_name = Column(String(100), nullable=False)
-    birth_date = Column(Date, nullable=True)
-    email = Column(String(255), nullable=False)
-    location = Column(String(200), nullable=False)
-    photo_file = Column(String(500), nullable=True)  # File upload path
-
-    # Multilingual Biography
-    bio_en = Column(Text, nullable=False)
-    bio_es = Column(Text, nullable=True)
+    name: Mapped[str] = mapped_column(String(100))
+    last_name: Mapped[str] = mapped_column(String(100))
+    birth_date: Mapped[Optional[date]] = mapped_column(Date)
+    email: Mapped[str] = mapped_column(String(255))
+    location: Mapped[str] = mapped_column(String(200))
+    photo_file: Mapped[Optional[str]] = mapped_column(String(500))  # File upload path
+
+    # Multilingual Biography (large bodies, deferred until explicitly requested)
+    bio_en: Mapped[str] = mapped_column(Text, deferred=True, deferred_group="bio")
+    bio_es: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="bio"
+    )
 
     # Hero Section
-    hero_description_en = Column(Text, nullable=True)
-    hero_description_es = Column(Text, nullable=True)
+    hero_description_en: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="bio"
+    )
+    hero_description_es: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="bio"
+    )
 
     # Job Title
-    job_title_en = Column(String(200), nullable=True)
-    job_title_es = Column(String(200), nullable=True)
+    job_title_en: Mapped[Optional[str]] = mapped_column(String(200))
+    job_title_es: Mapped[Optional[str]] = mapped_column(String(200))
 
     # Nationality
-    nationality_en = Column(String(100), nullable=False, server_default="Spanish")
-    nationality_es = Column(String(100), nullable=True, server_default="Español")
+    nationality_en: Mapped[str] = mapped_column(String(100), server_default="Spanish")
+    nationality_es: Mapped[Optional[str]] = mapped_column(
+        String(100), server_default="Español"
+    )
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
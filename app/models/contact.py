@@ -1,6 +1,10 @@
 """Contact model for contact information and social media."""
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -11,29 +15,38 @@ class Contact(Base):
 
     __tablename__ = "contact"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Contact Methods
-    email = Column(String(255), nullable=False)
-    sender_name = Column(String(255), nullable=True)  # Name for email signatures
+    email: Mapped[str] = mapped_column(String(255))
+    # Name for email signatures
+    sender_name: Mapped[Optional[str]] = mapped_column(String(255))
 
     # Social Media Links
-    linkedin_url = Column(String(500), nullable=True)
-    github_url = Column(String(500), nullable=True)
+    linkedin_url: Mapped[Optional[str]] = mapped_column(String(500))
+    github_url: Mapped[Optional[str]] = mapped_column(String(500))
 
     # Contact Form Settings
-    contact_form_enabled = Column(Boolean, default=True)
+    contact_form_enabled: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
-    # Multilingual Contact Messages
-    contact_message_en = Column(Text, nullable=True)
-    contact_message_es = Column(Text, nullable=True)
+    # Multilingual Contact Messages (deferred until explicitly requested)
+    contact_message_en: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="contact_message"
+    )
+    contact_message_es: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="contact_message"
+    )
 
     # CV/Resume
-    cv_file = Column(String(500), nullable=True)  # File upload path
+    cv_file: Mapped[Optional[str]] = mapped_column(String(500))  # File upload path
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
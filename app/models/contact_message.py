@@ -1,6 +1,10 @@
 """Contact message model for storing user messages."""
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -11,25 +15,30 @@ class ContactMessage(Base):
 
     __tablename__ = "contact_messages"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Sender Information
-    name = Column(String(255), nullable=False)
-    email = Column(String(255), nullable=False)
-    subject = Column(String(500), nullable=True)
+    name: Mapped[str] = mapped_column(String(255))
+    email: Mapped[str] = mapped_column(String(255))
+    subject: Mapped[Optional[str]] = mapped_column(String(500))
 
     # Message Content
-    message = Column(Text, nullable=False)
+    message: Mapped[str] = mapped_column(Text)
 
     # Optional phone number
-    phone = Column(String(50), nullable=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(50))
 
     # Status tracking
-    status = Column(String(50), default="new")  # new, read, replied, archived
+    # new, read, replied, archived
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="new")
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
@@ -1,6 +1,10 @@
 """Education model for educational background."""
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -11,26 +15,28 @@ class Education(Base):
 
     __tablename__ = "education"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Institution information
-    institution = Column(String(200), nullable=False)
-    location = Column(String(200), nullable=True)
+    institution: Mapped[str] = mapped_column(String(200))
+    location: Mapped[Optional[str]] = mapped_column(String(200))
 
     # Multilingual degree information
-    degree_en = Column(String(200), nullable=False)
-    degree_es = Column(String(200), nullable=True)
+    degree_en: Mapped[str] = mapped_column(String(200))
+    degree_es: Mapped[Optional[str]] = mapped_column(String(200))
 
     # Date range
-    start_date = Column(DateTime, nullable=False)
-    end_date = Column(DateTime, nullable=True)  # NULL for ongoing
+    start_date: Mapped[datetime] = mapped_column(DateTime)
+    end_date: Mapped[Optional[datetime]] = mapped_column(DateTime)  # NULL for ongoing
 
     # Display settings
-    display_order = Column(Integer, default=0)
-    activo = Column(Boolean, default=True)
+    display_order: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    activo: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
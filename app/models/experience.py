@@ -1,6 +1,10 @@
 """Experience model for work experience."""
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -11,28 +15,35 @@ class Experience(Base):
 
     __tablename__ = "experience"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Company information
-    company = Column(String(200), nullable=False)
-    location = Column(String(200), nullable=True)
+    company: Mapped[str] = mapped_column(String(200))
+    location: Mapped[Optional[str]] = mapped_column(String(200))
 
     # Multilingual position information
-    position_en = Column(String(200), nullable=False)
-    position_es = Column(String(200), nullable=True)
-    description_en = Column(Text, nullable=False)
-    description_es = Column(Text, nullable=True)
+    position_en: Mapped[str] = mapped_column(String(200))
+    position_es: Mapped[Optional[str]] = mapped_column(String(200))
+    description_en: Mapped[str] = mapped_column(
+        Text, deferred=True, deferred_group="description"
+    )
+    description_es: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="description"
+    )
 
     # Date range
-    start_date = Column(DateTime, nullable=False)
-    end_date = Column(DateTime, nullable=True)  # NULL for current position
+    start_date: Mapped[datetime] = mapped_column(DateTime)
+    # NULL for current position
+    end_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # Display settings
-    display_order = Column(Integer, default=0)
-    activo = Column(Boolean, default=True)
+    display_order: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    activo: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
@@ -1,5 +1,8 @@
 """Projects model for portfolio projects."""
 
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
 from sqlalchemy import (
     Boolean,
     Column,
@@ -10,11 +13,14 @@ from sqlalchemy import (
     Table,
     Text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from .skills import Skill
+
 # Association table for many-to-many relationship between projects and skills
 project_skills = Table(
     "project_skills",
@@ -29,30 +35,38 @@ class Project(Base):
 
     __tablename__ = "projects"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Multilingual project information
-    title_en = Column(String(200), nullable=False)
-    title_es = Column(String(200), nullable=True)
-    description_en = Column(Text, nullable=False)
-    description_es = Column(Text, nullable=True)
+    title_en: Mapped[str] = mapped_column(String(200))
+    title_es: Mapped[Optional[str]] = mapped_column(String(200))
+    description_en: Mapped[str] = mapped_column(
+        Text, deferred=True, deferred_group="description"
+    )
+    description_es: Mapped[Optional[str]] = mapped_column(
+        Text, deferred=True, deferred_group="description"
+    )
 
     # Visual details
-    image_file = Column(String(500), nullable=True)  # File upload path
+    image_file: Mapped[Optional[str]] = mapped_column(String(500))  # File upload path
 
     # Project links
-    source_url = Column(String(500), nullable=True)
-    demo_url = Column(String(500), nullable=True)
+    source_url: Mapped[Optional[str]] = mapped_column(String(500))
+    demo_url: Mapped[Optional[str]] = mapped_column(String(500))
 
     # Display settings
-    display_order = Column(Integer, default=0)
-    activa = Column(Boolean, default=True)
+    display_order: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    activa: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
     # Relationships
-    skills = relationship("Skill", secondary=project_skills, back_populates="projects")
+    skills: Mapped[List["Skill"]] = relationship(
+        secondary=project_skills, back_populates="projects"
+    )
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
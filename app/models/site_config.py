@@ -2,7 +2,11 @@
 Site Configuration model for Portfolio Backend API.
 """
 
-from sqlalchemy import Column, DateTime, Integer, String, func
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
@@ -12,94 +16,86 @@ class SiteConfig(Base):
 
     __tablename__ = "site_config"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Basic site information
-    site_title = Column(
-        String(200), nullable=False, index=True, info={"label": "Título del Sitio"}
+    site_title: Mapped[str] = mapped_column(
+        String(200), index=True, info={"label": "Título del Sitio"}
+    )
+    brand_name: Mapped[str] = mapped_column(
+        String(100), info={"label": "Nombre de la Marca"}
     )
-    brand_name = Column(
-        String(100), nullable=False, info={"label": "Nombre de la Marca"}
+    meta_description: Mapped[Optional[str]] = mapped_column(
+        String(500), info={"label": "Meta Descripción"}
     )
-    meta_description = Column(
-        String(500), nullable=True, info={"label": "Meta Descripción"}
+    meta_keywords: Mapped[Optional[str]] = mapped_column(
+        String(300), info={"label": "Meta Keywords"}
     )
-    meta_keywords = Column(String(300), nullable=True, info={"label": "Meta Keywords"})
 
     # Favicon
-    favicon_file = Column(
+    favicon_file: Mapped[Optional[str]] = mapped_column(
         String(500),
-        nullable=True,
         comment="Favicon file path",
         info={"label": "Archivo Favicon"},
     )
 
     # Open Graph metadata for social sharing
-    og_title = Column(
+    og_title: Mapped[Optional[str]] = mapped_column(
         String(200),
-        nullable=True,
         comment="Open Graph title for social sharing",
         info={"label": "Título OG"},
     )
-    og_description = Column(
+    og_description: Mapped[Optional[str]] = mapped_column(
         String(500),
-        nullable=True,
         comment="Open Graph description for social sharing",
         info={"label": "Descripción OG"},
     )
-    og_image_file = Column(
+    og_image_file: Mapped[Optional[str]] = mapped_column(
         String(500),
-        nullable=True,
         comment="Open Graph image file path",
         info={"label": "Archivo Imagen OG"},
     )
-    og_url = Column(
+    og_url: Mapped[Optional[str]] = mapped_column(
         String(300),
-        nullable=True,
         comment="Canonical URL for Open Graph",
         info={"label": "URL Canónica"},
     )
-    og_type = Column(
+    og_type: Mapped[Optional[str]] = mapped_column(
         String(50),
-        nullable=True,
         default="website",
         comment="Open Graph type (website, profile, etc.)",
         info={"label": "Tipo OG"},
     )
 
     # Twitter Card metadata
-    twitter_card = Column(
+    twitter_card: Mapped[Optional[str]] = mapped_column(
         String(50),
-        nullable=True,
         default="summary_large_image",
         comment="Twitter card type",
         info={"label": "Tipo de Twitter Card"},
     )
-    twitter_title = Column(
+    twitter_title: Mapped[Optional[str]] = mapped_column(
         String(200),
-        nullable=True,
         comment="Twitter card title",
         info={"label": "Título Twitter"},
     )
-    twitter_description = Column(
+    twitter_description: Mapped[Optional[str]] = mapped_column(
         String(500),
-        nullable=True,
         comment="Twitter card description",
         info={"label": "Descripción Twitter"},
     )
-    twitter_image_file = Column(
+    twitter_image_file: Mapped[Optional[str]] = mapped_column(
         String(500),
-        nullable=True,
         comment="Twitter card image file path",
         info={"label": "Archivo Imagen Twitter"},
     )
 
-    created_at = Column(
+    created_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         info={"label": "Fecha de Creación"},
     )
-    updated_at = Column(
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         onupdate=func.now(),
         info={"label": "Última Actualización"},
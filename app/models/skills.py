@@ -1,39 +1,49 @@
 """Skills and skill categories models."""
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from .projects import Project
+
 
 class SkillCategory(Base):
     """Model for skill categories."""
 
     __tablename__ = "skill_categories"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Category identifier
-    slug = Column(String(100), unique=True, nullable=False, index=True)
+    slug: Mapped[str] = mapped_column(String(100), unique=True, index=True)
 
     # Multilingual labels
-    label_en = Column(String(200), nullable=False)
-    label_es = Column(String(200), nullable=True)
+    label_en: Mapped[str] = mapped_column(String(200))
+    label_es: Mapped[Optional[str]] = mapped_column(String(200))
 
     # UI properties
-    icon_name = Column(String(100), nullable=False)
-    display_order = Column(Integer, default=0)
-    active = Column(Boolean, default=True)
+    icon_name: Mapped[str] = mapped_column(String(100))
+    display_order: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
     # Relationships
-    skills = relationship(
-        "Skill", back_populates="skill_category", cascade="all, delete-orphan"
+    skills: Mapped[List["Skill"]] = relationship(
+        back_populates="skill_category", cascade="all, delete-orphan"
     )
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
@@ -48,32 +58,40 @@ class Skill(Base):
 
     __tablename__ = "skills"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Multilingual skill names
-    name_en = Column(String(200), nullable=False)
-    name_es = Column(String(200), nullable=True)
+    name_en: Mapped[str] = mapped_column(String(200))
+    name_es: Mapped[Optional[str]] = mapped_column(String(200))
 
     # Category relationship
-    category_id = Column(Integer, ForeignKey("skill_categories.id"), nullable=True)
-    skill_category = relationship("SkillCategory", back_populates="skills")
+    category_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("skill_categories.id"), index=True
+    )
+    skill_category: Mapped[Optional["SkillCategory"]] = relationship(
+        back_populates="skills"
+    )
 
     # UI properties
-    icon_name = Column(String(100), nullable=False)
-    color = Column(String(50), nullable=True)
+    icon_name: Mapped[str] = mapped_column(String(100))
+    color: Mapped[Optional[str]] = mapped_column(String(50))
 
     # Status and ordering
-    display_order = Column(Integer, default=0)
-    active = Column(Boolean, default=True)
+    display_order: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
 
-    # Relationships - importing here to avoid circular imports
-    projects = relationship(
-        "Project", secondary="project_skills", back_populates="skills"
+    # Relationships - association table referenced by name to avoid circular imports
+    projects: Mapped[List["Project"]] = relationship(
+        secondary="project_skills", back_populates="skills"
     )
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
 
     def __str__(self):
         """String representation for admin interface."""
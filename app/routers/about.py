@@ -1,33 +1,30 @@
-from typing import Optional
-
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.deps.auth import get_db
+from app.deps.content import get_language
 from app.schemas.about import AboutResponse
 from app.services.about import about_service
-from app.utils.validation import validate_language
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
 
 router = APIRouter(prefix="/about", tags=["about"])
 
 
 @router.get("/", response_model=AboutResponse)
 async def get_about(
+    request: Request,
     db: Session = Depends(get_db),
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    lang: str = Depends(get_language),
 ):
     """Get about section content with optional language parameter."""
-    # Validate language
-    lang = validate_language(lang)
-
-    # Get the about record
-    about = about_service.get_about(db)
 
-    # Create response with language context
-    response = AboutResponse.model_validate(about)
-    response.language = lang  # Set requested language for computed properties
+    def build_body() -> bytes:
+        return about_service.get_about_response(db, lang).model_dump_json().encode()
 
-    return response
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("about", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
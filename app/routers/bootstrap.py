@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.deps.auth import get_db
+from app.deps.content import get_language
+from app.schemas.bootstrap import BootstrapResponse
+from app.services.about import about_service
+from app.services.contact import contact_service
+from app.services.education import education_service
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
+
+router = APIRouter(prefix="/content", tags=["content"])
+
+
+@router.get("/bootstrap", response_model=BootstrapResponse)
+async def get_bootstrap(
+    request: Request,
+    db: Session = Depends(get_db),
+    lang: str = Depends(get_language),
+):
+    """Get about, contact and education content in a single response."""
+
+    def build_body() -> bytes:
+        response = BootstrapResponse.model_construct(
+            about=about_service.get_about_response(db, lang),
+            contact=contact_service.get_contact_response(db, lang),
+            education=education_service.get_education_responses(db, lang),
+        )
+        return response.model_dump_json().encode()
+
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("bootstrap", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
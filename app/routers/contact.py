@@ -1,10 +1,9 @@
-from typing import Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.config import settings
 from app.deps.auth import get_db
+from app.deps.content import get_language
 from app.schemas.contact import (
     ContactMessageRequest,
     ContactMessageResponse,
@@ -12,30 +11,29 @@ from app.schemas.contact import (
 )
 from app.services.contact import contact_service
 from app.services.contact_message import contact_message_service
-from app.utils.validation import validate_language
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
 
 router = APIRouter(prefix="/contact", tags=["contact"])
 
 
 @router.get("/", response_model=ContactResponse)
 async def get_contact(
+    request: Request,
     db: Session = Depends(get_db),
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    lang: str = Depends(get_language),
 ):
     """Get contact section content with optional language parameter."""
-    # Validate language
-    lang = validate_language(lang)
 
-    # Get the contact record
-    contact = contact_service.get_contact(db)
+    def build_body() -> bytes:
+        return contact_service.get_contact_response(db, lang).model_dump_json().encode()
 
-    # Create response with language context
-    response = ContactResponse.model_validate(contact)
-    response.language = lang  # Set requested language for computed properties
-
-    return response
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("contact", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
 
 
 @router.post(
@@ -44,23 +42,18 @@ async def get_contact(
 async def send_contact_message(
     message_data: ContactMessageRequest,
     db: Session = Depends(get_db),
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    lang: str = Depends(get_language),
 ):
     """Send a contact message through the contact form."""
     try:
         # Check if contact form is enabled
-        contact_info = contact_service.get_contact(db)
+        contact_info = await run_in_threadpool(contact_service.get_contact, db)
         if contact_info and not contact_info.contact_form_enabled:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Contact form is currently disabled",
             )
 
-        # Validate language
-        lang = validate_language(lang)
-
         # Create the contact message
         response = await contact_message_service.create_contact_message(
             db, message_data, lang
@@ -1,35 +1,38 @@
-from typing import List, Optional
+from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.deps.auth import get_db
+from app.deps.content import get_language
 from app.schemas.education import EducationResponse
 from app.services.education import education_service
-from app.utils.validation import validate_language
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
 
 router = APIRouter(prefix="/education", tags=["education"])
 
+# Serializer for the whole response list, built once at import time
+education_list_adapter = TypeAdapter(List[EducationResponse])
+
 
 @router.get("/", response_model=List[EducationResponse])
 async def get_education_records(
+    request: Request,
     db: Session = Depends(get_db),
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    lang: str = Depends(get_language),
 ):
     """Get all education records with multilingual support."""
-    # Validate language
-    lang = validate_language(lang)
-
-    education_records = education_service.get_education_records(db)
 
-    # Create response with language context
-    education_responses = []
-    for education in education_records:
-        response = EducationResponse.model_validate(education)
-        response.language = lang  # Set requested language for computed properties
-        education_responses.append(response)
+    def build_body() -> bytes:
+        return education_list_adapter.dump_json(
+            education_service.get_education_responses(db, lang)
+        )
 
-    return education_responses
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("education", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
@@ -1,35 +1,45 @@
-from typing import List, Optional
+from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.deps.auth import get_db
+from app.deps.content import get_language
 from app.schemas.experience import ExperienceResponse
 from app.services.experience import experience_service
-from app.utils.validation import validate_language
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
+from app.utils.validation import construct_response
 
 router = APIRouter(prefix="/experience", tags=["experience"])
 
+# Serializer for the whole response list, built once at import time
+experience_list_adapter = TypeAdapter(List[ExperienceResponse])
+
 
 @router.get("/", response_model=List[ExperienceResponse])
 async def get_experiences(
+    request: Request,
     db: Session = Depends(get_db),
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    lang: str = Depends(get_language),
 ):
     """Get all work experiences with multilingual support."""
-    # Validate language
-    lang = validate_language(lang)
 
-    experiences = experience_service.get_experiences(db)
+    def build_body() -> bytes:
+        experiences = experience_service.get_experiences(db)
+
+        # Rows come straight from the database, so skip per-row validation
+        experience_responses = [
+            construct_response(experience, ExperienceResponse, lang)
+            for experience in experiences
+        ]
 
-    # Create response with language context
-    experience_responses = []
-    for experience in experiences:
-        response = ExperienceResponse.model_validate(experience)
-        response.language = lang  # Set requested language for computed properties
-        experience_responses.append(response)
+        return experience_list_adapter.dump_json(experience_responses)
 
-    return experience_responses
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("experience", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
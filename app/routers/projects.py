@@ -1,29 +1,54 @@
-from typing import List, Optional
+from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.deps.auth import get_db
+from app.deps.content import get_language
 from app.schemas.projects import ProjectResponse
+from app.schemas.skills import SkillResponse
 from app.services.projects import project_service
-from app.utils.validation import build_response_with_language, validate_language
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
+from app.utils.validation import construct_response
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Serializer for the whole response list, built once at import time
+project_list_adapter = TypeAdapter(List[ProjectResponse])
+
 
 @router.get("/", response_model=List[ProjectResponse])
 async def get_projects(
+    request: Request,
     db: Session = Depends(get_db),
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    lang: str = Depends(get_language),
 ):
     """Get all projects with multilingual support."""
-    # Validate language
-    lang = validate_language(lang)
 
-    projects = project_service.get_projects(db)
+    def build_body() -> bytes:
+        projects = project_service.get_projects(db)
+
+        # Rows come straight from the database, so skip per-row validation. Skills
+        # are still validated since their schema normalizes hex colors.
+        project_responses = [
+            construct_response(
+                project,
+                ProjectResponse,
+                lang,
+                skills=[
+                    SkillResponse.model_validate(skill) for skill in project.skills
+                ],
+            )
+            for project in projects
+        ]
+
+        return project_list_adapter.dump_json(project_responses)
 
-    # Create response with language context
-    return build_response_with_language(projects, ProjectResponse, lang)
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("projects", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
@@ -2,32 +2,34 @@
 Site Configuration router for Portfolio Backend API.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from app.deps.auth import get_db
 from app.schemas.site_config import SiteConfigResponse
 from app.services.site_config import site_config_service
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
 
 router = APIRouter(prefix="/site-config", tags=["site-config"])
 
 
 @router.get("/", response_model=SiteConfigResponse)
-async def get_site_config(db: Session = Depends(get_db)):
+async def get_site_config(request: Request, db: Session = Depends(get_db)):
     """Get site configuration (public endpoint)."""
-    try:
-        site_config = await site_config_service.get_cached_site_config(db)
+
+    def build_body() -> bytes:
+        site_config = site_config_service.get_site_config(db)
         if not site_config:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Site configuration not found",
             )
-        return site_config
-    except HTTPException:
-        # Re-raise HTTP exceptions to preserve status codes
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving site configuration: {str(e)}",
-        )
+        return SiteConfigResponse.model_validate(site_config).model_dump_json().encode()
+
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("site_config",), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
@@ -1,27 +1,31 @@
-from typing import Optional
-
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.deps.auth import get_db
+from app.deps.content import get_language
 from app.schemas.skills import SkillsGroupedResponse
 from app.services.skills import skill_service
-from app.utils.validation import validate_language
+from app.utils.response_cache import (
+    PUBLIC_CACHE_CONTROL,
+    json_response,
+    response_cache,
+)
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
 
 @router.get("/", response_model=SkillsGroupedResponse)
 async def get_skills_grouped(
-    lang: Optional[str] = Query(
-        default=settings.default_language, description="Language code (en, es)"
-    ),
+    request: Request,
+    lang: str = Depends(get_language),
     db: Session = Depends(get_db),
 ):
     """Get skills grouped by categories with multilingual support."""
-    # Validate language
-    lang = validate_language(lang)
 
-    # Get grouped skills from service
-    return await skill_service.get_skills_grouped(db, lang)
+    def build_body() -> bytes:
+        # Get grouped skills from service
+        return skill_service.get_skills_grouped(db, lang).model_dump_json().encode()
+
+    # Serve the pre-serialized body to skip FastAPI's re-serialization
+    body = await response_cache.get_or_set(("skills", lang), build_body)
+    return json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
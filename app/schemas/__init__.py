@@ -2,6 +2,7 @@
 
 # Individual domain schemas
 from .about import AboutResponse
+from .bootstrap import BootstrapResponse
 from .contact import ContactResponse
 from .education import EducationResponse
 from .experience import ExperienceResponse
@@ -17,6 +18,7 @@ from .skills import (
 
 __all__ = [
     "AboutResponse",
+    "BootstrapResponse",
     "ContactResponse",
     "EducationResponse",
     "ExperienceResponse",
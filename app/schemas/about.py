@@ -2,19 +2,32 @@
 
 import re
 from datetime import date, datetime
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Dict, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSAFE_CONTENT_RE = re.compile(r"<script|javascript:|onclick=|onerror=", re.IGNORECASE)
+
+# Stripped by pydantic-core before the length constraints, so blank values fail
+TrimmedStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class AboutBase(BaseModel):
     """Base schema for About with common fields."""
 
-    name: str = Field(..., min_length=1, max_length=100, description="First name")
-    last_name: str = Field(..., min_length=1, max_length=100, description="Last name")
+    name: TrimmedStr = Field(
+        ..., min_length=1, max_length=100, description="First name"
+    )
+    last_name: TrimmedStr = Field(
+        ..., min_length=1, max_length=100, description="Last name"
+    )
     birth_date: Optional[date] = Field(None, description="Birth date")
     email: str = Field(..., description="Email address")
-    location: str = Field(..., min_length=1, max_length=200, description="Location")
+    location: TrimmedStr = Field(
+        ..., min_length=1, max_length=200, description="Location"
+    )
     photo_file: Optional[str] = Field(None, description="Photo file path")
 
     # Multilingual fields
@@ -36,33 +49,30 @@ class AboutBase(BaseModel):
     job_title_es: Optional[str] = Field(
         None, max_length=200, description="Job title in Spanish"
     )
-    nationality_en: str = Field(
+    nationality_en: TrimmedStr = Field(
         ..., min_length=1, max_length=100, description="Nationality in English"
     )
-    nationality_es: Optional[str] = Field(
+    nationality_es: Optional[TrimmedStr] = Field(
         None, max_length=100, description="Nationality in Spanish"
     )
 
-    @validator("email")
-    def validate_email(cls, v):
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        if not email_pattern.match(v):
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Validate email format."""
+        if not _EMAIL_RE.match(v):
             raise ValueError("Invalid email format")
         return v.lower()
 
-    @validator("photo_file")
-    def validate_photo_file(cls, v):
+    @field_validator("photo_file")
+    @classmethod
+    def validate_photo_file(cls, v: Optional[str]) -> Optional[str]:
+        """Validate photo file path."""
         if v and not v.startswith("/uploads/"):
             raise ValueError("Photo file must be an uploaded file path")
         return v
 
-    @validator("name", "last_name", "location", "nationality_en", "nationality_es")
-    def validate_text_fields(cls, v):
-        if v and not v.strip():
-            raise ValueError("Field cannot be empty or only whitespace")
-        return v.strip() if v else v
-
-    @validator(
+    @field_validator(
         "bio_en",
         "bio_es",
         "hero_description_en",
@@ -70,15 +80,17 @@ class AboutBase(BaseModel):
         "job_title_en",
         "job_title_es",
     )
-    def validate_content_fields(cls, v):
+    @classmethod
+    def validate_content_fields(cls, v: Optional[str]) -> Optional[str]:
+        """Normalize whitespace and reject unsafe markup in content fields."""
         if v:
-            v = re.sub(r"\s+", " ", v.strip())
-            suspicious_patterns = ["<script", "javascript:", "onclick=", "onerror="]
-            for pattern in suspicious_patterns:
-                if pattern.lower() in v.lower():
-                    raise ValueError(
-                        f"Content contains potentially unsafe elements: {pattern}"
-                    )
+            v = _WHITESPACE_RE.sub(" ", v.strip())
+            unsafe = _UNSAFE_CONTENT_RE.search(v)
+            if unsafe:
+                raise ValueError(
+                    "Content contains potentially unsafe elements: "
+                    f"{unsafe.group(0).lower()}"
+                )
         return v
 
 
@@ -95,8 +107,7 @@ class AboutResponse(AboutBase):
         None, description="Photo file as Base64 data URL"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @property
     def bio(self) -> str:
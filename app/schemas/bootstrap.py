@@ -0,0 +1,17 @@
+"""Bootstrap schema combining the content needed on initial page load."""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from .about import AboutResponse
+from .contact import ContactResponse
+from .education import EducationResponse
+
+
+class BootstrapResponse(BaseModel):
+    """Schema for the combined about, contact and education response."""
+
+    about: AboutResponse
+    contact: ContactResponse
+    education: List[EducationResponse]
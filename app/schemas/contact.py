@@ -4,7 +4,9 @@ import re
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+_PHONE_FORMATTING_RE = re.compile(r"[^\d+\-\(\)\s]")
 
 
 class ContactBase(BaseModel):
@@ -42,8 +44,7 @@ class ContactResponse(ContactBase):
         None, description="CV file as Base64 data URL"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @property
     def contact_message(self) -> Optional[str]:
@@ -58,7 +59,7 @@ class ContactMessageRequest(BaseModel):
     """Schema for contact message requests."""
 
     name: str = Field(..., min_length=1, max_length=255, description="Sender's name")
-    email: str = Field(..., description="Sender's email address")
+    email: EmailStr = Field(..., description="Sender's email address")
     subject: Optional[str] = Field(None, max_length=500, description="Message subject")
     message: str = Field(
         ..., min_length=1, max_length=5000, description="Message content"
@@ -69,12 +70,9 @@ class ContactMessageRequest(BaseModel):
 
     @field_validator("email")
     @classmethod
-    def validate_email(cls, v: str) -> str:
-        """Validate email format."""
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, v):
-            raise ValueError("Invalid email format")
-        return v.lower().strip()
+    def normalize_email(cls, v: str) -> str:
+        """Lowercase the validated email address."""
+        return v.lower()
 
     @field_validator("name")
     @classmethod
@@ -94,7 +92,7 @@ class ContactMessageRequest(BaseModel):
         """Validate and clean phone number."""
         if v:
             # Remove common phone formatting characters
-            cleaned = re.sub(r"[^\d+\-\(\)\s]", "", v.strip())
+            cleaned = _PHONE_FORMATTING_RE.sub("", v.strip())
             return cleaned if cleaned else None
         return v
 
@@ -106,5 +104,4 @@ class ContactMessageResponse(BaseModel):
     message: str = Field(..., description="Response message")
     id: Optional[str] = Field(None, description="Message ID (optional)")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
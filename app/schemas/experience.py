@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class ExperienceBase(BaseModel):
@@ -38,8 +38,7 @@ class ExperienceResponse(ExperienceBase):
     created_at: datetime
     language: Optional[str] = "en"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @field_serializer("start_date", "end_date")
     def serialize_date(self, value: Optional[datetime]) -> Optional[str]:
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .skills import SkillResponse
 
@@ -41,8 +41,7 @@ class ProjectResponse(BaseModel):
         None, description="Project image as Base64 data URL"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @property
     def title(self) -> str:
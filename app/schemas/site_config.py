@@ -5,7 +5,7 @@ Site Configuration schemas for Portfolio Backend API.
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SiteConfigBase(BaseModel):
@@ -104,5 +104,4 @@ class SiteConfigResponse(SiteConfigBase):
         None, description="Twitter image file as Base64 data URL"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -4,7 +4,7 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.utils.iconify import (
     format_hex_color,
@@ -12,6 +12,9 @@ from app.utils.iconify import (
     validate_hex_color,
 )
 
+_SLUG_RE = re.compile(r"^[a-z0-9_]+$")
+_COLOR_NAME_RE = re.compile(r"^(text-\w+(-\d+)?|\w+)$")
+
 
 class SkillCategoryBase(BaseModel):
     """Base schema for SkillCategory with common fields."""
@@ -34,15 +37,18 @@ class SkillCategoryBase(BaseModel):
     display_order: Optional[int] = Field(0, ge=0, le=1000, description="Display order")
     active: Optional[bool] = Field(True, description="Whether category is active")
 
-    @validator("slug")
-    def validate_slug(cls, v):
-        if not v or not v.strip():
+    @field_validator("slug")
+    @classmethod
+    def validate_slug(cls, v: str) -> str:
+        """Validate and normalize the category slug."""
+        slug = v.strip().lower()
+        if not slug:
             raise ValueError("Slug cannot be empty")
-        if not re.match(r"^[a-z0-9_]+$", v.strip().lower()):
+        if not _SLUG_RE.match(slug):
             raise ValueError(
                 "Slug can only contain lowercase letters, numbers, and underscores"
             )
-        return v.strip().lower()
+        return slug
 
 
 class SkillCategoryResponse(SkillCategoryBase):
@@ -53,8 +59,7 @@ class SkillCategoryResponse(SkillCategoryBase):
     updated_at: Optional[datetime] = None
     language: Optional[str] = "en"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     @property
     def label(self) -> str:
@@ -83,8 +88,10 @@ class SkillBase(BaseModel):
     )
     active: Optional[bool] = Field(True, description="Whether skill is active")
 
-    @validator("color")
-    def validate_color(cls, v):
+    @field_validator("color")
+    @classmethod
+    def validate_color(cls, v: Optional[str]) -> Optional[str]:
+        """Validate hex colors, Tailwind classes and CSS color names."""
         if v:
             if not v.strip():
                 return None
@@ -100,7 +107,7 @@ class SkillBase(BaseModel):
                 return format_hex_color(stripped_v)
 
             # Check if it's a Tailwind CSS class or valid CSS color name
-            if not re.match(r"^(text-\w+(-\d+)?|\w+)$", stripped_v):
+            if not _COLOR_NAME_RE.match(stripped_v):
                 raise ValueError(
                     "Invalid color format. Use hex colors (#FF0000), Tailwind classes "
                     "(text-blue-500), or CSS color names"
@@ -117,8 +124,7 @@ class SkillResponse(SkillBase):
     updated_at: Optional[datetime] = None
     language: Optional[str] = "en"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     @property
     def name(self) -> str:
@@ -139,8 +145,7 @@ class SkillNestedResponse(BaseModel):
     icon_name: str
     color: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class CategoryWithSkillsResponse(BaseModel):
@@ -151,8 +156,7 @@ class CategoryWithSkillsResponse(BaseModel):
     icon_name: str
     skills: List[SkillNestedResponse]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SkillsGroupedResponse(BaseModel):
@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 
 from app.models.about import About
+from app.schemas.about import AboutResponse
 from app.services.base import SingletonService
 
 
@@ -16,6 +17,12 @@ class AboutService(SingletonService[About]):
         """Get about section content."""
         return self.get_or_404(db)
 
+    def get_about_response(self, db: Session, lang: str) -> AboutResponse:
+        """Get about section content as a response in the requested language."""
+        response = AboutResponse.model_validate(self.get_about(db))
+        response.language = lang  # Set requested language for computed properties
+        return response
+
 
 # Global service instance
 about_service = AboutService()
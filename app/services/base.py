@@ -2,11 +2,13 @@
 
 import logging
 from abc import ABC
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Generic, List, Optional, Tuple, Type, TypeVar
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, undefer
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.config import settings
 from app.database import Base
 from app.exceptions import ContentNotFoundError, DatabaseError
 from app.utils.cache import cache_manager
@@ -17,6 +19,18 @@ T = TypeVar("T", bound=Base)
 logger = logging.getLogger(__name__)
 
 
+def load_options(*options: ORMOption) -> Tuple[ORMOption, ...]:
+    """
+    Return query loader options, adding raiseload("*") when strict loading is on.
+
+    With settings.strict_loading enabled (dev/test), any relationship that is not
+    eagerly loaded by the given options raises instead of lazy loading.
+    """
+    if settings.strict_loading:
+        return (*options, raiseload("*"))
+    return options
+
+
 class BaseService(Generic[T], ABC):
     """Base service class with common CRUD operations and caching."""
 
@@ -27,7 +41,7 @@ class BaseService(Generic[T], ABC):
     def get_by_id(self, db: Session, id: int) -> Optional[T]:
         """Get a record by ID."""
         try:
-            return db.query(self.model).filter(self.model.id == id).first()
+            return db.get(self.model, id)
         except SQLAlchemyError as e:
             logger.error(f"Database error in {self.model_name} get_by_id: {str(e)}")
             raise DatabaseError(f"Failed to fetch {self.model_name}")
@@ -38,10 +52,11 @@ class BaseService(Generic[T], ABC):
             query = db.query(self.model)
 
             # Add active filter if model has active field
-            if hasattr(self.model, "activo"):
-                query = query.filter(self.model.activo.is_(True))
-            elif hasattr(self.model, "activa"):
-                query = query.filter(self.model.activa.is_(True))
+            active = getattr(self.model, "activo", None)
+            if active is None:
+                active = getattr(self.model, "activa", None)
+            if active is not None:
+                query = query.filter(active.is_(True))
 
             # Add ordering
             query = self._apply_default_ordering(query)
@@ -56,7 +71,8 @@ class BaseService(Generic[T], ABC):
     def get_first(self, db: Session) -> Optional[T]:
         """Get the first record (for singleton models like About, Contact)."""
         try:
-            return db.query(self.model).first()
+            # Singleton reads feed the public API, so load deferred text bodies too
+            return db.query(self.model).options(*load_options(undefer("*"))).first()
         except SQLAlchemyError as e:
             logger.error(f"Database error in {self.model_name} get_first: {str(e)}")
             raise DatabaseError(f"Failed to fetch {self.model_name}")
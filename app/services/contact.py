@@ -3,7 +3,9 @@
 from sqlalchemy.orm import Session
 
 from app.models.contact import Contact
+from app.schemas.contact import ContactResponse
 from app.services.base import SingletonService
+from app.utils.validation import construct_response
 
 
 class ContactService(SingletonService[Contact]):
@@ -16,6 +18,11 @@ class ContactService(SingletonService[Contact]):
         """Get contact information."""
         return self.get_or_404(db)
 
+    def get_contact_response(self, db: Session, lang: str) -> ContactResponse:
+        """Get contact information as a response in the requested language."""
+        # ContactResponse has no validators, so the trusted row is copied as is
+        return construct_response(self.get_contact(db), ContactResponse, lang)
+
 
 # Global service instance
 contact_service = ContactService()
@@ -5,6 +5,7 @@ from typing import Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.exceptions import DatabaseError, ValidationError
 from app.models.contact_message import ContactMessage
@@ -21,20 +22,11 @@ class ContactMessageService:
     ) -> ContactMessageResponse:
         """Create a new contact message."""
         try:
-            # Create the contact message
-            contact_message = ContactMessage(
-                name=message_data.name,
-                email=message_data.email,
-                subject=message_data.subject,
-                message=message_data.message,
-                phone=message_data.phone,
-                status="new",
+            # Persist off the event loop; the Session is sync
+            contact_message = await run_in_threadpool(
+                self._save_contact_message, db, message_data
             )
 
-            db.add(contact_message)
-            db.commit()
-            db.refresh(contact_message)
-
             logger.info(
                 f"Contact message created: {contact_message.message_id} "
                 f"from {contact_message.email}"
@@ -66,6 +58,24 @@ class ContactMessageService:
             logger.error(f"Database error creating contact message: {str(e)}")
             raise DatabaseError(f"Database error: {str(e)}")
 
+    def _save_contact_message(
+        self, db: Session, message_data: ContactMessageRequest
+    ) -> ContactMessage:
+        """Insert a new contact message and return the refreshed row."""
+        contact_message = ContactMessage(
+            name=message_data.name,
+            email=message_data.email,
+            subject=message_data.subject,
+            message=message_data.message,
+            phone=message_data.phone,
+            status="new",
+        )
+
+        db.add(contact_message)
+        db.commit()
+        db.refresh(contact_message)
+        return contact_message
+
     def get_contact_message(
         self, db: Session, message_id: int
     ) -> Optional[ContactMessage]:
@@ -7,6 +7,9 @@ from sqlalchemy.orm import Session
 
 from app.exceptions import ContentNotFoundError
 from app.models.education import Education
+from app.schemas.education import EducationResponse
+from app.services.base import load_options
+from app.utils.validation import construct_response
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,7 @@ class EducationService:
 
         return (
             db.query(Education)
+            .options(*load_options())
             .order_by(
                 Education.display_order,
                 case(
@@ -34,9 +38,24 @@ class EducationService:
             .all()
         )
 
+    def get_education_responses(
+        self, db: Session, lang: str
+    ) -> List[EducationResponse]:
+        """Get all education records as responses in the requested language."""
+        # Rows come straight from the database, so skip per-row validation
+        return [
+            construct_response(education, EducationResponse, lang)
+            for education in self.get_education_records(db)
+        ]
+
     def get_education_by_id(self, db: Session, education_id: int) -> Education:
         """Get education record by ID."""
-        education = db.query(Education).filter(Education.id == education_id).first()
+        education = (
+            db.query(Education)
+            .options(*load_options())
+            .filter(Education.id == education_id)
+            .first()
+        )
         if not education:
             raise ContentNotFoundError("education", education_id)
         return education
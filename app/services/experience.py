@@ -3,10 +3,11 @@
 import logging
 from typing import List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.exceptions import ContentNotFoundError
 from app.models.experience import Experience
+from app.services.base import load_options
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,11 @@ class ExperienceService:
 
         return (
             db.query(Experience)
+            .options(
+                *load_options(
+                    undefer_group("description"),  # Load deferred descriptions
+                )
+            )
             .order_by(
                 Experience.display_order,
                 case(
@@ -33,7 +39,12 @@ class ExperienceService:
 
     def get_experience_by_id(self, db: Session, experience_id: int) -> Experience:
         """Get experience by ID."""
-        experience = db.query(Experience).filter(Experience.id == experience_id).first()
+        experience = (
+            db.query(Experience)
+            .options(*load_options(undefer_group("description")))
+            .filter(Experience.id == experience_id)
+            .first()
+        )
         if not experience:
             raise ContentNotFoundError("experience", experience_id)
         return experience
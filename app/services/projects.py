@@ -3,10 +3,11 @@
 import logging
 from typing import List
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload, undefer_group
 
 from app.exceptions import ContentNotFoundError
 from app.models.projects import Project
+from app.services.base import load_options
 from app.utils.file_utils import encode_file_to_base64
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,12 @@ class ProjectService:
         """Get all projects ordered by display order and creation date."""
         projects = (
             db.query(Project)
-            .options(joinedload(Project.skills))  # Eager load skills
+            .options(
+                *load_options(
+                    selectinload(Project.skills),  # Eager load skills
+                    undefer_group("description"),  # Load deferred descriptions
+                )
+            )
             .order_by(Project.display_order, Project.created_at.desc())
             .all()
         )
@@ -34,7 +40,12 @@ class ProjectService:
         """Get project by ID."""
         project = (
             db.query(Project)
-            .options(joinedload(Project.skills))  # Eager load skills
+            .options(
+                *load_options(
+                    selectinload(Project.skills),  # Eager load skills
+                    undefer_group("description"),  # Load deferred descriptions
+                )
+            )
             .filter(Project.id == project_id)
             .first()
         )
@@ -47,10 +58,12 @@ class ProjectService:
     def _process_project_data(self, project: Project) -> None:
         """Process project data - add image data."""
         # Add image data if image_file exists
-        if hasattr(project, "image_file") and project.image_file:
-            project.image_data = encode_file_to_base64(str(project.image_file))
-        else:
-            project.image_data = None
+        image_file = getattr(project, "image_file", None)
+        setattr(
+            project,
+            "image_data",
+            encode_file_to_base64(str(image_file)) if image_file else None,
+        )
 
 
 # Global service instance
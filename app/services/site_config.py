@@ -5,14 +5,15 @@ Site Configuration service for Portfolio Backend API.
 import logging
 from typing import Optional
 
+from sqlalchemy import delete
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.exceptions import ContentNotFoundError, DatabaseError, ValidationError
 from app.models.site_config import SiteConfig
 from app.schemas.site_config import SiteConfigCreate, SiteConfigUpdate
-from app.utils.cache import ContentCache, cached
 from app.utils.file_utils import encode_file_to_base64
+from app.utils.response_cache import response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -23,29 +24,13 @@ class SiteConfigService:
         site_config = db.query(SiteConfig).first()
         if site_config:
             # Add file data if files exist
-            if hasattr(site_config, "favicon_file") and site_config.favicon_file:
-                site_config.favicon_data = encode_file_to_base64(
-                    str(site_config.favicon_file)
+            for field in ("favicon", "og_image", "twitter_image"):
+                file_path = getattr(site_config, f"{field}_file", None)
+                setattr(
+                    site_config,
+                    f"{field}_data",
+                    encode_file_to_base64(str(file_path)) if file_path else None,
                 )
-            else:
-                site_config.favicon_data = None
-
-            if hasattr(site_config, "og_image_file") and site_config.og_image_file:
-                site_config.og_image_data = encode_file_to_base64(
-                    str(site_config.og_image_file)
-                )
-            else:
-                site_config.og_image_data = None
-
-            if (
-                hasattr(site_config, "twitter_image_file")
-                and site_config.twitter_image_file
-            ):
-                site_config.twitter_image_data = encode_file_to_base64(
-                    str(site_config.twitter_image_file)
-                )
-            else:
-                site_config.twitter_image_data = None
 
         return site_config
 
@@ -68,8 +53,8 @@ class SiteConfigService:
             db.commit()
             db.refresh(site_config)
 
-            # Clear any cached site config
-            await ContentCache.invalidate_content_cache("site_config")
+            # Drop cached responses that embed the site config
+            response_cache.clear()
 
             logger.info(f"Site configuration created: {site_config.site_title}")
             return site_config
@@ -96,8 +81,8 @@ class SiteConfigService:
             db.commit()
             db.refresh(site_config)
 
-            # Clear cached site config
-            await ContentCache.invalidate_content_cache("site_config")
+            # Drop cached responses that embed the site config
+            response_cache.clear()
 
             logger.info(f"Site configuration updated: {site_config.site_title}")
             return site_config
@@ -110,15 +95,14 @@ class SiteConfigService:
     async def delete_site_config(self, db: Session) -> None:
         """Delete site configuration."""
         try:
-            site_config = db.query(SiteConfig).first()
-            if not site_config:
+            # Singleton table: delete the row in one statement, no pre-SELECT
+            deleted_id = db.scalars(delete(SiteConfig).returning(SiteConfig.id)).first()
+            if deleted_id is None:
                 raise ContentNotFoundError("site_config", 0)
-
-            db.delete(site_config)
             db.commit()
 
-            # Clear cached site config
-            await ContentCache.invalidate_content_cache("site_config")
+            # Drop cached responses that embed the site config
+            response_cache.clear()
 
             logger.info("Site configuration deleted")
 
@@ -127,11 +111,6 @@ class SiteConfigService:
             logger.error(f"Database error deleting site config: {str(e)}")
             raise DatabaseError(f"Database error: {str(e)}")
 
-    @cached(ttl=3600, key_prefix="site_config")  # Cache for 1 hour
-    async def get_cached_site_config(self, db: Session) -> Optional[SiteConfig]:
-        """Get cached site configuration."""
-        return self.get_site_config(db)
-
 
 # Global service instance
 site_config_service = SiteConfigService()
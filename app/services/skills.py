@@ -1,9 +1,10 @@
 """Skills service for handling skills and categories operations."""
 
 import logging
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.exceptions import ContentNotFoundError
 from app.models.skills import Skill, SkillCategory
@@ -12,7 +13,8 @@ from app.schemas.skills import (
     SkillNestedResponse,
     SkillsGroupedResponse,
 )
-from app.utils.cache import cache_manager, cached
+from app.services.base import load_options
+from app.utils.cache import cache_manager
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class SkillCategoryService:
         """Get all active skill categories."""
         return (
             db.query(SkillCategory)
+            .options(*load_options())
             .filter(SkillCategory.active.is_(True))
             .order_by(SkillCategory.display_order, SkillCategory.label_en)
             .all()
@@ -64,31 +67,58 @@ class SkillCategoryService:
 class SkillService:
     """Service for managing individual skills."""
 
-    @cached(ttl=600, key_prefix="skills_grouped")  # Cache for 10 minutes
-    async def get_skills_grouped(
+    def get_skills_grouped(
         self, db: Session, language: str = "en"
     ) -> SkillsGroupedResponse:
         """Get skills grouped by categories in the nested structure."""
+        # Only the columns the nested response renders are loaded
         categories = (
             db.query(SkillCategory)
+            .options(
+                *load_options(
+                    load_only(
+                        SkillCategory.slug,
+                        SkillCategory.label_en,
+                        SkillCategory.label_es,
+                        SkillCategory.icon_name,
+                    )
+                )
+            )
             .filter(SkillCategory.active.is_(True))
             .order_by(SkillCategory.display_order)
             .all()
         )
 
-        grouped_categories = []
-        for category in categories:
-            # Get skills for this category
-            skills = (
-                db.query(Skill)
-                .filter(Skill.category_id == category.id, Skill.active.is_(True))
-                .order_by(Skill.display_order, Skill.name_en)
-                .all()
+        # Load all active skills of these categories in one query, then group
+        skills_by_category: Dict[int, List[Skill]] = defaultdict(list)
+        skills = (
+            db.query(Skill)
+            .options(
+                *load_options(
+                    load_only(
+                        Skill.category_id,
+                        Skill.name_en,
+                        Skill.name_es,
+                        Skill.icon_name,
+                        Skill.color,
+                    )
+                )
+            )
+            .filter(
+                Skill.category_id.in_([category.id for category in categories]),
+                Skill.active.is_(True),
             )
+            .order_by(Skill.display_order, Skill.name_en)
+            .all()
+        )
+        for skill in skills:
+            skills_by_category[skill.category_id].append(skill)
 
+        grouped_categories = []
+        for category in categories:
             # Build skills list
             category_skills = []
-            for skill in skills:
+            for skill in skills_by_category[category.id]:
                 skill_name = (
                     skill.name_es
                     if language == "es" and skill.name_es
@@ -121,7 +151,7 @@ class SkillService:
 
     def get_skills(self, db: Session, category_id: Optional[int] = None) -> List[Skill]:
         """Get all skills, optionally filtered by category ID."""
-        query = db.query(Skill).filter(Skill.active.is_(True))
+        query = db.query(Skill).options(*load_options()).filter(Skill.active.is_(True))
         if category_id:
             query = query.filter(Skill.category_id == category_id)
         return query.order_by(Skill.display_order, Skill.name_en).all()
@@ -2,8 +2,14 @@
 
 from .validation import (
     build_response_with_language,
+    construct_response,
     get_multilingual_text,
     validate_language,
 )
 
-__all__ = ["validate_language", "get_multilingual_text", "build_response_with_language"]
+__all__ = [
+    "validate_language",
+    "get_multilingual_text",
+    "build_response_with_language",
+    "construct_response",
+]
@@ -124,6 +124,31 @@ ICON_VARIATIONS = {
     "vscode": ["vscode", "visual-studio-code", "code"],
 }
 
+# Separators stripped from icon names during normalization
+_ICON_SEPARATORS = re.compile(r"[_\s-]+")
+
+# 3 or 6 hex digits (without the leading #)
+_HEX_DIGITS = re.compile(r"[0-9a-fA-F]{3}|[0-9a-fA-F]{6}")
+
+# Normalized variation -> canonical name. Built in reverse so that, as with the
+# original linear scan, the first canonical listing a variation wins.
+_ICON_VARIATION_LOOKUP: Dict[str, str] = {
+    variation.lower().replace("-", "").replace("_", ""): canonical
+    for canonical, variations in reversed(ICON_VARIATIONS.items())
+    for variation in variations
+}
+
+# Generic UI icons offered by search when technology matches run short
+_UI_ICONS = (
+    "code",
+    "database",
+    "server",
+    "settings",
+    "smartphone",
+    "briefcase",
+    "graduation-cap",
+)
+
 
 def normalize_icon_name(icon_name: str) -> str:
     """
@@ -139,16 +164,10 @@ def normalize_icon_name(icon_name: str) -> str:
         return ""
 
     # Convert to lowercase and replace separators
-    normalized = re.sub(r"[_\s-]+", "", icon_name.lower())
+    normalized = _ICON_SEPARATORS.sub("", icon_name.lower())
 
     # Check for variations
-    for canonical, variations in ICON_VARIATIONS.items():
-        if normalized in [
-            v.lower().replace("-", "").replace("_", "") for v in variations
-        ]:
-            return canonical
-
-    return normalized
+    return _ICON_VARIATION_LOOKUP.get(normalized, normalized)
 
 
 def validate_hex_color(color: str) -> bool:
@@ -164,11 +183,8 @@ def validate_hex_color(color: str) -> bool:
     if not color:
         return False
 
-    # Remove # if present
-    color = color.lstrip("#")
-
-    # Check if it's a valid hex color (3 or 6 characters)
-    return bool(re.match(r"^[0-9a-fA-F]{3}$|^[0-9a-fA-F]{6}$", color))
+    # Check if it's a valid hex color (3 or 6 characters), ignoring any #
+    return _HEX_DIGITS.fullmatch(color.lstrip("#")) is not None
 
 
 def format_hex_color(color: str) -> str:
@@ -340,16 +356,7 @@ def search_icons(query: str, limit: int = 10) -> List[Dict[str, str]]:
                 break
 
     # Add UI icons if not enough technology matches
-    ui_icons = [
-        "code",
-        "database",
-        "server",
-        "settings",
-        "smartphone",
-        "briefcase",
-        "graduation-cap",
-    ]
-    for ui_icon in ui_icons:
+    for ui_icon in _UI_ICONS:
         if len(matches) >= limit:
             break
         if query_lower in ui_icon and not any(m["name"] == ui_icon for m in matches):
@@ -0,0 +1,122 @@
+"""
+In-process TTL cache for serialized API responses.
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.config import settings
+from app.exceptions import DatabaseError
+from app.utils.logging import get_logger
+
+logger = get_logger("portfolio.response_cache")
+
+
+class ResponseCache:
+    """Small TTL cache holding already-serialized JSON response bodies."""
+
+    def __init__(self, maxsize: int = 32, ttl: int = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Expired bodies are kept until evicted for space, as a stale fallback
+        self._entries: Dict[Hashable, Tuple[float, bytes]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def _lookup(self, key: Hashable, now: float) -> Optional[bytes]:
+        """Return a fresh cached body for key, if any."""
+        entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        return None
+
+    def _store(self, key: Hashable, body: bytes, now: float) -> None:
+        """Store body for key, evicting the oldest entries when full."""
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + self.ttl, body)
+
+    async def get_or_set(self, key: Hashable, builder: Callable[[], bytes]) -> bytes:
+        """
+        Get the cached body for key, building and storing it on a miss.
+        Only caches in production environment.
+
+        The builder usually does blocking database work on a sync Session, so it
+        runs in the threadpool rather than on the event loop. Misses are built
+        under a per-key lock, so a slow build does not hold up other keys. If the
+        build fails with a database error, the expired body for the key is served
+        instead when there is one.
+
+        Args:
+            key: Cache key, e.g. ("about", lang)
+            builder: Callable returning the serialized response body
+        """
+        if not settings.should_enable_cache:
+            return await run_in_threadpool(builder)
+
+        body = self._lookup(key, time.monotonic())
+        if body is not None:
+            return body
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            body = self._lookup(key, time.monotonic())
+            if body is not None:
+                return body
+
+            logger.debug(f"Response cache miss for {key}")
+            try:
+                body = await run_in_threadpool(builder)
+            except (SQLAlchemyError, DatabaseError):
+                # Serve the expired body, if any, while the database is down
+                stale = self._entries.get(key)
+                if stale is None:
+                    raise
+                logger.warning(f"Serving stale response for {key}")
+                return stale[1]
+            self._store(key, body, time.monotonic())
+            return body
+
+    def clear(self) -> None:
+        """Invalidate all cached responses."""
+        self._entries.clear()
+        logger.info("Response cache cleared")
+
+
+# Global response cache instance
+response_cache = ResponseCache()
+
+# Cache-Control for public content that changes rarely
+PUBLIC_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def make_etag(body: bytes) -> str:
+    """Build a weak ETag from a serialized response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def json_response(
+    request: Request, body: bytes, cache_control: Optional[str] = None
+) -> Response:
+    """Return a pre-serialized JSON body, or 304 Not Modified if the ETag matches."""
+    headers = {"ETag": make_etag(body)}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
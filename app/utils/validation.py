@@ -1,6 +1,8 @@
 """Validation utilities for common application patterns."""
 
-from typing import List, Optional, TypeVar, Union
+import sys
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -8,6 +10,12 @@ from app.config import settings
 
 T = TypeVar("T", bound=BaseModel)
 
+# Supported language codes, resolved once at import time
+_SUPPORTED_LANGUAGES = frozenset(
+    sys.intern(code) for code in settings.supported_languages
+)
+_DEFAULT_LANGUAGE = sys.intern(settings.default_language)
+
 
 def validate_language(lang: Optional[str]) -> str:
     """
@@ -19,9 +27,36 @@ def validate_language(lang: Optional[str]) -> str:
     Returns:
         Valid language code (defaults to settings.default_language if invalid)
     """
-    if lang and lang in settings.supported_languages:
-        return lang
-    return settings.default_language
+    return lang if lang in _SUPPORTED_LANGUAGES else _DEFAULT_LANGUAGE
+
+
+@lru_cache(maxsize=None)
+def _response_fields(response_class: type[BaseModel]) -> Tuple[str, ...]:
+    """Field names copied from a database row into response_class."""
+    return tuple(name for name in response_class.model_fields if name != "language")
+
+
+def construct_response(
+    item: object, response_class: type[T], language: str, **values: Any
+) -> T:
+    """
+    Build a response object from a trusted database row without validation.
+
+    Args:
+        item: Database model object
+        response_class: Pydantic response class
+        language: Language code to set
+        **values: Field values to use instead of the row's attributes
+
+    Returns:
+        Response object with language set
+    """
+    data = {
+        name: getattr(item, name)
+        for name in _response_fields(response_class)
+        if name not in values and hasattr(item, name)
+    }
+    return response_class.model_construct(**data, **values, language=language)
 
 
 def get_multilingual_text(text_en: str, text_es: Optional[str], language: str) -> str:
@@ -1,12 +1,14 @@
 """Test configuration and fixtures."""
 import pytest
+from contextlib import contextmanager
 from datetime import date
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.config import settings
 from app.database import Base
 from app.deps.auth import get_db
 
@@ -38,6 +40,17 @@ def override_get_db():
 app.dependency_overrides[get_db] = override_get_db
 
 
+@pytest.fixture(scope="session", autouse=True)
+def strict_loading():
+    """Fail fast on accidental lazy relationship loads."""
+    previous = settings.strict_loading
+    settings.strict_loading = True
+    try:
+        yield
+    finally:
+        settings.strict_loading = previous
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create test database tables and provide a database session."""
@@ -55,6 +68,27 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def count_queries(db_session):
+    """Return a context manager recording the SQL statements run inside it."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", record_statement)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", record_statement)
+
+    return counter
+
+
 @pytest.fixture(scope="function")
 def client():
     """Create test client."""
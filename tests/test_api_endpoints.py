@@ -107,6 +107,18 @@ class TestAPIEndpoints:
         assert education["degree_en"] == "Test Degree"
         assert education["language"] == "en"
     
+    def test_bootstrap_endpoint(self, client: TestClient, test_data):
+        """Test the combined about, contact and education endpoint."""
+        response = client.get("/api/v1/content/bootstrap?lang=es")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["about"]["name"] == "Test"
+        assert data["about"]["language"] == "es"
+        assert data["contact"]["email"] == "contact@example.com"
+        assert data["education"][0]["institution"] == "Test University"
+        assert data["education"][0]["language"] == "es"
+    
     def test_invalid_language_defaults_to_english(self, client: TestClient, test_data):
         """Test that invalid language parameter defaults to English."""
         response = client.get("/api/v1/about/?lang=invalid")
@@ -164,6 +176,92 @@ class TestAPIErrorHandling:
         response = client.get("/api/v1/site-config/")
         assert response.status_code == 404
     
+    def test_about_endpoint_serves_stale_body_on_database_error(
+        self, client: TestClient, test_data, monkeypatch
+    ):
+        """Test a singleton endpoint falls back to its expired cached body."""
+        from app.config import settings
+        from app.exceptions import DatabaseError
+        from app.services.about import about_service
+        from app.utils.response_cache import response_cache
+        
+        monkeypatch.setattr(settings, "environment", "production")
+        monkeypatch.setattr(response_cache, "ttl", 0)  # Cached bodies expire at once
+        response_cache.clear()
+        try:
+            fresh = client.get("/api/v1/about/")
+            assert fresh.status_code == 200
+            
+            def failing_get_first(db):
+                raise DatabaseError("Failed to fetch About")
+            
+            monkeypatch.setattr(about_service, "get_first", failing_get_first)
+            stale = client.get("/api/v1/about/")
+            assert stale.status_code == 200
+            assert stale.content == fresh.content
+        finally:
+            response_cache.clear()
+    
+    def test_site_config_write_invalidates_cached_response(
+        self, client: TestClient, db_session, test_data, monkeypatch
+    ):
+        """Test a site config write through the service is visible immediately."""
+        import asyncio
+        from app.config import settings
+        from app.schemas.site_config import SiteConfigUpdate
+        from app.services.site_config import site_config_service
+        from app.utils.response_cache import response_cache
+        
+        monkeypatch.setattr(settings, "environment", "production")
+        response_cache.clear()
+        try:
+            assert client.get("/api/v1/site-config/").json()["site_title"] == "Test Portfolio"
+            
+            asyncio.run(
+                site_config_service.update_site_config(
+                    db_session, SiteConfigUpdate(site_title="Updated Portfolio")
+                )
+            )
+            
+            response = client.get("/api/v1/site-config/")
+            assert response.json()["site_title"] == "Updated Portfolio"
+        finally:
+            response_cache.clear()
+    
+    def test_admin_about_edit_invalidates_cached_response(
+        self, client: TestClient, db_session, test_data, monkeypatch
+    ):
+        """Test an About edit saved through the admin is served on the next GET."""
+        import asyncio
+        from app.admin.views import AboutAdmin
+        from app.config import settings
+        from app.main import admin, app
+        from app.middleware.performance import CacheMiddleware
+        from app.models.about import About
+        from app.utils.response_cache import response_cache
+        
+        # No second HTTP cache layer may hold on to the old body
+        assert all(m.cls is not CacheMiddleware for m in app.user_middleware)
+        
+        monkeypatch.setattr(settings, "environment", "production")
+        response_cache.clear()
+        try:
+            assert client.get("/api/v1/about/").json()["name"] == "Test"
+            
+            about = db_session.query(About).first()
+            about.name = "Edited"
+            db_session.commit()
+            
+            # Still cached until the admin hook runs
+            assert client.get("/api/v1/about/").json()["name"] == "Test"
+            
+            view = next(v for v in admin.views if isinstance(v, AboutAdmin))
+            asyncio.run(view.after_model_change({}, about, False))
+            
+            assert client.get("/api/v1/about/").json()["name"] == "Edited"
+        finally:
+            response_cache.clear()
+    
     def test_contact_message_validation_errors(self, client: TestClient, test_data):
         """Test contact message endpoint validation errors."""
         # Test missing required fields
@@ -228,4 +326,36 @@ class TestAPIResponseFormat:
                 for item in data:
                     assert "language" in item
             else:
-                assert "language" in data
\ No newline at end of file
+                assert "language" in data
+
+    def test_content_endpoints_support_etag(self, client: TestClient, test_data):
+        """Test that content endpoints return an ETag and honour If-None-Match."""
+        from app.utils.response_cache import PUBLIC_CACHE_CONTROL
+
+        endpoints = [
+            "/api/v1/about/",
+            "/api/v1/contact/",
+            "/api/v1/education/",
+            "/api/v1/experience/",
+            "/api/v1/projects/",
+            "/api/v1/skills/",
+        ]
+        for endpoint in endpoints + ["/api/v1/site-config/"]:
+            response = client.get(endpoint)
+            assert response.status_code == 200
+            etag = response.headers["etag"]
+
+            response = client.get(endpoint, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
+
+        for endpoint in endpoints:
+            # A different language yields a different representation
+            etag = client.get(endpoint).headers["etag"]
+            response = client.get(f"{endpoint}?lang=es", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+
+        # Every content endpoint shares one browser caching policy
+        for endpoint in endpoints + ["/api/v1/site-config/", "/api/v1/content/bootstrap"]:
+            response = client.get(endpoint)
+            assert response.headers["cache-control"] == PUBLIC_CACHE_CONTROL
@@ -1,9 +1,13 @@
 """Test service layer functionality."""
+import asyncio
+
 import pytest
 from sqlalchemy.orm import Session
 
 from app.services.about import about_service
 from app.services.contact import contact_service
+from app.services.projects import project_service
+from app.services.skills import skill_service
 from app.services.site_config import site_config_service
 from app.exceptions import ContentNotFoundError
 
@@ -25,6 +29,42 @@ class TestBaseService:
         with pytest.raises(ContentNotFoundError):
             about_service.get_about(db_session)
     
+    def test_about_schema_rejects_whitespace_only_text(self):
+        """Test whitespace-only values are rejected, including optional fields."""
+        from pydantic import ValidationError as SchemaValidationError
+        from app.schemas.about import AboutBase
+        
+        values = {
+            "name": " Test ",
+            "last_name": "User",
+            "email": "test@example.com",
+            "location": "Test City",
+            "bio_en": "Test bio in English",
+            "nationality_en": "Test",
+        }
+        assert AboutBase(**values).name == "Test"
+        assert AboutBase(**values).nationality_es is None
+        
+        for field in ("name", "nationality_es"):
+            with pytest.raises(SchemaValidationError):
+                AboutBase(**{**values, field: "   "})
+    
+    def test_collection_service_lookups(self, db_session: Session, test_data):
+        """Test get_by_id and the activo/activa filters of the base service."""
+        from app.models.education import Education
+        from app.models.projects import Project
+        from app.services.base import CollectionService
+        
+        education_service = CollectionService(Education)
+        education = test_data["education"]
+        assert education_service.get_by_id(db_session, education.id) is education
+        assert education_service.get_by_id(db_session, education.id + 1) is None
+        
+        db_session.add(Project(title_en="Hidden", description_en="Hidden", activa=False))
+        db_session.commit()
+        projects = CollectionService(Project).get_all_active(db_session)
+        assert [project.title_en for project in projects] == ["Test Project"]
+    
     def test_contact_service_get_contact(self, db_session: Session, test_data):
         """Test contact service get_contact method."""
         contact = contact_service.get_contact(db_session)
@@ -46,6 +86,73 @@ class TestBaseService:
         assert site_config.site_title == "Test Portfolio"
         assert site_config.meta_description == "Test Description"
 
+    def test_site_config_service_delete_site_config(
+        self, db_session: Session, test_data
+    ):
+        """Test deleting the site config removes it and then raises 404."""
+        asyncio.run(site_config_service.delete_site_config(db_session))
+        assert site_config_service.get_site_config(db_session) is None
+
+        with pytest.raises(ContentNotFoundError):
+            asyncio.run(site_config_service.delete_site_config(db_session))
+
+    def test_get_projects_loads_skills_without_n_plus_one(
+        self, db_session: Session, test_data, count_queries
+    ):
+        """Test projects and their skills load in a constant number of queries."""
+        from app.models.projects import Project
+
+        for index in range(5):
+            project = Project(title_en=f"Project {index}", description_en="Extra")
+            project.skills.append(test_data["skill"])
+            db_session.add(project)
+        db_session.commit()
+        db_session.expire_all()
+
+        with count_queries() as statements:
+            projects = project_service.get_projects(db_session)
+            skill_names = [skill.name_en for p in projects for skill in p.skills]
+
+        assert len(projects) == 6
+        assert skill_names.count("Test Skill") == 6
+        # One query for the projects, one selectin query for all their skills
+        assert len(statements) == 2
+
+    def test_get_skills_grouped_uses_one_skills_query(
+        self, db_session: Session, test_data, count_queries
+    ):
+        """Test grouped skills load in two queries regardless of category count."""
+        from app.models.skills import Skill, SkillCategory
+
+        for index in range(3):
+            category = SkillCategory(
+                slug=f"extra-{index}",
+                label_en=f"Extra {index}",
+                icon_name="ExtraIcon",
+                display_order=index + 2,
+            )
+            db_session.add(category)
+            db_session.flush()
+            db_session.add(
+                Skill(
+                    name_en=f"Skill {index}",
+                    category_id=category.id,
+                    icon_name="SkillIcon",
+                    color="#00FF00",
+                )
+            )
+        db_session.commit()
+
+        with count_queries() as statements:
+            grouped = skill_service.get_skills_grouped(db_session, "es")
+
+        assert [category.id for category in grouped.categories] == [
+            "test", "extra-0", "extra-1", "extra-2"
+        ]
+        assert grouped.categories[0].skills[0].name == "Habilidad de Prueba"
+        assert grouped.categories[3].skills[0].name == "Skill 2"
+        assert len(statements) == 2
+
 
 class TestFileDataHandling:
     """Test file data handling in services."""
@@ -98,4 +205,42 @@ class TestFileDataHandling:
         
         # Should have photo_data as None
         assert hasattr(result, 'photo_data')
-        assert result.photo_data is None
\ No newline at end of file
+        assert result.photo_data is None
+
+
+class TestResponseCache:
+    """Test the serialized response cache."""
+    
+    def test_stale_body_survives_other_keys_refreshing(self, monkeypatch):
+        """Test an expired body is kept and served when its rebuild hits a DB error."""
+        from app.config import settings
+        from app.exceptions import DatabaseError
+        from app.utils.response_cache import ResponseCache
+        
+        monkeypatch.setattr(settings, "environment", "production")
+        cache = ResponseCache(ttl=0)  # Every entry is already expired on lookup
+        
+        def failing_builder() -> bytes:
+            raise DatabaseError("Database unavailable")
+        
+        async def scenario():
+            await cache.get_or_set("a", lambda: b'{"key": "a"}')
+            await cache.get_or_set("b", lambda: b'{"key": "b"}')
+            return await cache.get_or_set("a", failing_builder)
+        
+        assert asyncio.run(scenario()) == b'{"key": "a"}'
+    
+    def test_database_error_without_stale_body_is_raised(self, monkeypatch):
+        """Test a failed build is re-raised when nothing was cached for the key."""
+        from app.config import settings
+        from app.exceptions import DatabaseError
+        from app.utils.response_cache import ResponseCache
+        
+        monkeypatch.setattr(settings, "environment", "production")
+        cache = ResponseCache()
+        
+        def failing_builder() -> bytes:
+            raise DatabaseError("Database unavailable")
+        
+        with pytest.raises(DatabaseError):
+            asyncio.run(cache.get_or_set("a", failing_builder))